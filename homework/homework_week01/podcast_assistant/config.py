@@ -2,8 +2,9 @@ import os
 from enum import Enum
 from typing import Dict
 
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
 load_dotenv()
 
@@ -99,11 +100,33 @@ class PodcastConstants(Enum):
     DEFAULT_SEARCH_RESULTS_LIMIT = 3
     DEFAULT_VECTOR_SEARCH_RESULTS = 5
 
+    # Concurrency constants
+    DEFAULT_BATCH_CONCURRENCY = 16
+
     # Confidence range constants
     MIN_CONFIDENCE = 0.0
     MAX_CONFIDENCE = 1.0
 
 
+class HTTPClientConfig(Enum):
+    """Connection pooling for the shared OpenAI clients"""
+
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 16
+    KEEPALIVE_EXPIRY = 60  # Seconds an idle connection is kept for reuse
+
+
 # OpenAI configuration
 API_KEY = os.getenv("OPENAI_API_KEY")
-openai_client = OpenAI(api_key=API_KEY)
+_http_limits = httpx.Limits(
+    max_connections=HTTPClientConfig.MAX_CONNECTIONS.value,
+    max_keepalive_connections=HTTPClientConfig.MAX_KEEPALIVE_CONNECTIONS.value,
+    keepalive_expiry=HTTPClientConfig.KEEPALIVE_EXPIRY.value,
+)
+# Shared clients: reuse pooled connections instead of a new TLS handshake per call
+openai_client = OpenAI(
+    api_key=API_KEY, http_client=DefaultHttpxClient(limits=_http_limits)
+)
+async_openai_client = AsyncOpenAI(  # For streaming responses
+    api_key=API_KEY, http_client=DefaultAsyncHttpxClient(limits=_http_limits)
+)
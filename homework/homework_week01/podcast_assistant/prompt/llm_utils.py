@@ -1,18 +1,42 @@
 # LLM interaction utilities
+import asyncio
 import re
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from config import (
     InstructionType,
     ModelType,
     PodcastConstants,
+    async_openai_client,
 )
-from openai import OpenAI
+from config import openai_client as default_openai_client
+from openai import AsyncOpenAI, OpenAI
 
 from .models import RAGAnswer
 from .prompt_builder import build_prompt
 from .search_utils import RAGError, search_documents
 
+_FALLBACK_NOTICE = "⚠️  Structured output failed, trying fallback..."
+
+
+def _build_messages(
+    question: str,
+    search_results: List[Dict[str, Any]],
+    instruction_type: InstructionType,
+) -> List[Dict[str, str]]:
+    """Build the user message list sent for a question and its search results"""
+    user_prompt: str = build_prompt(question, search_results, instruction_type)
+    return [{"role": "user", "content": user_prompt}]
+
+
+def _validate_answer(rag_answer: RAGAnswer) -> RAGAnswer:
+    """Reject structured answers with no answer text"""
+    if not rag_answer.answer.strip():
+        raise RAGError("Empty answer received from LLM")
+    return rag_answer
+
 
 def query_with_context(
     question: str,
@@ -26,7 +50,7 @@ def query_with_context(
     Args:
         question: The question to answer
         index: The search index to retrieve relevant documents
-        openai_client: OpenAI client for generating responses
+        openai_client: OpenAI client (default: shared pooled client from config)
         instruction_type: Type of instruction/prompt template to use
 
     Returns:
@@ -36,41 +60,91 @@ def query_with_context(
         RAGError: If any error occurs during processing
     """
     if openai_client is None:
-        raise RAGError("OpenAI client is required")
+        openai_client = default_openai_client
 
     try:
-        # Import here to avoid circular imports
-
         # Search for relevant documents
         search_results: List[Dict[str, Any]] = search_documents(question, index)
-
-        # Build the prompt
-        user_prompt: str = build_prompt(question, search_results, instruction_type)
-
-        # Prepare messages
-        messages = [{"role": "user", "content": user_prompt}]
+        messages = _build_messages(question, search_results, instruction_type)
 
         # Try structured output first
         try:
             response = openai_client.responses.parse(
-                model=ModelType.GPT_4O_MINI.value, input=messages, text_format=RAGAnswer
+                model=ModelType.GPT_4O_MINI.value,
+                input=messages,
+                text_format=RAGAnswer,
+                prompt_cache_key=instruction_type.value,
             )
+            return _validate_answer(response.output_parsed)
 
-            # Validate the response
-            rag_answer = response.output_parsed
-            if not rag_answer.answer.strip():
-                raise RAGError("Empty answer received from LLM")
+        except Exception as e:
+            # If structured output fails, try fallback
+            print(_FALLBACK_NOTICE)
+            try:
+                return _generate_fallback_response(
+                    question, search_results, openai_client
+                )
+            except Exception:
+                raise RAGError(
+                    f"Both structured and fallback responses failed: {str(e)}"
+                ) from e
 
-            return rag_answer
+    except RAGError:
+        raise
+    except Exception as e:
+        raise RAGError(f"Unexpected error in RAG processing: {str(e)}") from e
+
+
+async def query_with_context_async(
+    question: str,
+    index: Any | None = None,
+    openai_client: AsyncOpenAI | None = None,
+    instruction_type: InstructionType = InstructionType.PODCAST_ASSISTANT,
+) -> RAGAnswer:
+    """
+    Answer a question using RAG with structured Pydantic output, asynchronously.
+
+    Same pipeline as query_with_context, but the index search runs in a worker
+    thread and both LLM calls use the async client, so many questions can be
+    awaited together with asyncio.gather.
+
+    Args:
+        question: The question to answer
+        index: The search index to retrieve relevant documents
+        openai_client: Async OpenAI client (default: shared pooled client from config)
+        instruction_type: Type of instruction/prompt template to use
+
+    Returns:
+        Structured RAGAnswer with validated data
+
+    Raises:
+        RAGError: If any error occurs during processing
+    """
+    if openai_client is None:
+        openai_client = async_openai_client
+
+    try:
+        # Search is synchronous; keep it off the event loop
+        search_results: List[Dict[str, Any]] = await asyncio.to_thread(
+            search_documents, question, index
+        )
+        messages = _build_messages(question, search_results, instruction_type)
+
+        try:
+            response = await openai_client.responses.parse(
+                model=ModelType.GPT_4O_MINI.value,
+                input=messages,
+                text_format=RAGAnswer,
+                prompt_cache_key=instruction_type.value,
+            )
+            return _validate_answer(response.output_parsed)
 
         except Exception as e:
-            # If structured output fails, try fallback
-            print("⚠️  Structured output failed, trying fallback...")
+            print(_FALLBACK_NOTICE)
             try:
-                fallback_response = _generate_fallback_response(
+                return await _generate_fallback_response_async(
                     question, search_results, openai_client
                 )
-                return fallback_response
             except Exception:
                 raise RAGError(
                     f"Both structured and fallback responses failed: {str(e)}"
@@ -82,6 +156,159 @@ def query_with_context(
         raise RAGError(f"Unexpected error in RAG processing: {str(e)}") from e
 
 
+async def query_with_context_stream(
+    question: str,
+    index: Any | None = None,
+    openai_client: AsyncOpenAI | None = None,
+    instruction_type: InstructionType = InstructionType.PODCAST_ASSISTANT,
+) -> AsyncIterator[str]:
+    """
+    Answer a question using RAG, yielding the answer text as it is generated.
+
+    Unlike query_with_context, the answer is plain text rather than a
+    structured RAGAnswer, so callers can render tokens as soon as they arrive.
+
+    Args:
+        question: The question to answer
+        index: The search index to retrieve relevant documents
+        openai_client: Async OpenAI client (default: shared pooled client from config)
+        instruction_type: Type of instruction/prompt template to use
+
+    Yields:
+        Chunks of the answer text in generation order
+
+    Raises:
+        RAGError: If any error occurs during processing
+    """
+    if openai_client is None:
+        openai_client = async_openai_client
+
+    # Search is synchronous; keep it off the event loop
+    search_results: List[Dict[str, Any]] = await asyncio.to_thread(
+        search_documents, question, index
+    )
+    messages = _build_messages(question, search_results, instruction_type)
+
+    try:
+        async with openai_client.responses.stream(
+            model=ModelType.GPT_4O_MINI.value,
+            input=messages,
+            prompt_cache_key=instruction_type.value,
+        ) as stream:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+    except Exception as e:
+        raise RAGError(f"Streaming response failed: {str(e)}") from e
+
+
+def query_with_context_batch(
+    questions: List[str],
+    index: Any | None = None,
+    openai_client: OpenAI | None = None,
+    instruction_type: InstructionType = InstructionType.PODCAST_ASSISTANT,
+    max_workers: int = PodcastConstants.DEFAULT_BATCH_CONCURRENCY.value,
+) -> List[RAGAnswer | RAGError]:
+    """
+    Answer several questions concurrently with query_with_context.
+
+    Each question spends most of its time waiting on the OpenAI API, so the
+    calls run in a thread pool instead of one after another. A failing
+    question does not abort the batch: its slot holds the RAGError instead.
+
+    Args:
+        questions: The questions to answer
+        index: The search index to retrieve relevant documents
+        openai_client: OpenAI client (default: shared pooled client from config)
+        instruction_type: Type of instruction/prompt template to use
+        max_workers: Maximum number of questions processed at the same time
+
+    Returns:
+        One RAGAnswer or RAGError per question, in the same order as the questions
+    """
+    if openai_client is None:
+        openai_client = default_openai_client
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                query_with_context, question, index, openai_client, instruction_type
+            )
+            for question in questions
+        ]
+
+    results: List[RAGAnswer | RAGError] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except RAGError as e:
+            results.append(e)
+    return results
+
+
+def _build_fallback_messages(
+    question: str, search_results: List[Dict[str, Any]]
+) -> List[Dict[str, str]]:
+    """Build a plain-text prompt for the fallback when structured output fails"""
+    context_text = "\n\n".join(
+        [
+            f"Source: {result.get('filename', 'unknown')}\n{result.get('content', '')[:PodcastConstants.MAX_CONTEXT_LENGTH.value]}"
+            for result in search_results[
+                : PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value
+            ]
+        ]
+    )
+
+    fallback_prompt = f"""
+Answer this question based on the provided context:
+
+Question: {question}
+
+Context:
+{context_text}
+
+Provide a clear answer and rate your confidence from 0.0 to 1.0.
+"""
+
+    return [{"role": "user", "content": fallback_prompt}]
+
+
+def _parse_fallback_answer(
+    output_text: str, search_results: List[Dict[str, Any]]
+) -> RAGAnswer:
+    """Manually parse a plain-text fallback answer into a RAGAnswer"""
+    answer_text = output_text.strip()
+
+    # Extract confidence if mentioned
+    confidence = (
+        PodcastConstants.DEFAULT_FALLBACK_CONFIDENCE.value
+    )  # Default confidence
+    if "confidence" in answer_text.lower():
+        try:
+            confidence_match = re.search(
+                r"confidence[:\s]+([0-9.]+)", answer_text.lower()
+            )
+            if confidence_match:
+                confidence = float(confidence_match.group(1))
+        except (ValueError, AttributeError):
+            pass
+
+    # Extract sources
+    sources_used = [
+        result.get("filename", "unknown")
+        for result in search_results[
+            : PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value
+        ]
+    ]
+
+    return RAGAnswer(
+        answer=answer_text,
+        confidence=confidence,
+        sources_used=sources_used,
+        reasoning="Generated using fallback method due to structured output failure",
+    )
+
+
 def _generate_fallback_response(
     question: str, search_results: List[Dict[str, Any]], openai_client: OpenAI
 ) -> RAGAnswer:
@@ -104,64 +331,39 @@ def _generate_fallback_response(
         RAGError: If fallback response generation fails
     """
     try:
-        # Create a simple prompt for fallback
-        context_text = "\n\n".join(
-            [
-                f"Source: {result.get('filename', 'unknown')}\n{result.get('content', '')[:PodcastConstants.MAX_CONTEXT_LENGTH.value]}"
-                for result in search_results[
-                    : PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value
-                ]
-            ]
+        response = openai_client.responses.create(
+            model=ModelType.GPT_4O_MINI.value,
+            input=_build_fallback_messages(question, search_results),
         )
+        return _parse_fallback_answer(response.output_text, search_results)
 
-        fallback_prompt = f"""
-Answer this question based on the provided context:
-
-Question: {question}
-
-Context:
-{context_text}
-
-Provide a clear answer and rate your confidence from 0.0 to 1.0.
-"""
+    except Exception as e:
+        raise RAGError(f"Fallback response generation failed: {str(e)}") from e
 
-        messages = [{"role": "user", "content": fallback_prompt}]
 
-        response = openai_client.responses.create(
-            model=ModelType.GPT_4O_MINI.value, input=messages
-        )
+async def _generate_fallback_response_async(
+    question: str, search_results: List[Dict[str, Any]], openai_client: AsyncOpenAI
+) -> RAGAnswer:
+    """
+    Async counterpart of _generate_fallback_response using the caller's client.
 
-        # Parse the response manually
-        answer_text = response.output_text.strip()
+    Args:
+        question: The user's question to be answered
+        search_results: List of relevant document dictionaries from search
+        openai_client: Async OpenAI client for API calls
 
-        # Extract confidence if mentioned
-        confidence = (
-            PodcastConstants.DEFAULT_FALLBACK_CONFIDENCE.value
-        )  # Default confidence
-        if "confidence" in answer_text.lower():
-            try:
-                confidence_match = re.search(
-                    r"confidence[:\s]+([0-9.]+)", answer_text.lower()
-                )
-                if confidence_match:
-                    confidence = float(confidence_match.group(1))
-            except (ValueError, AttributeError):
-                pass
-
-        # Extract sources
-        sources_used = [
-            result.get("filename", "unknown")
-            for result in search_results[
-                : PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value
-            ]
-        ]
+    Returns:
+        RAGAnswer object with parsed response data
 
-        return RAGAnswer(
-            answer=answer_text,
-            confidence=confidence,
-            sources_used=sources_used,
-            reasoning="Generated using fallback method due to structured output failure",
+    Raises:
+        RAGError: If fallback response generation fails
+    """
+    try:
+        response = await openai_client.responses.create(
+            model=ModelType.GPT_4O_MINI.value,
+            input=_build_fallback_messages(question, search_results),
         )
+        return _parse_fallback_answer(response.output_text, search_results)
 
     except Exception as e:
         raise RAGError(f"Fallback response generation failed: {str(e)}") from e
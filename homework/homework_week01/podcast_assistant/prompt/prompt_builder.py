@@ -1,11 +1,17 @@
 # Prompt building utilities
-import json
 from typing import Any, Dict, List
 
 from config import (
     InstructionType,
     PromptTemplate,
 )
+from pydantic_core import to_json
+
+# Template text per instruction type, resolved once instead of per prompt
+_PROMPT_TEMPLATES: Dict[InstructionType, str] = {
+    instruction_type: PromptTemplate[instruction_type.name].value
+    for instruction_type in InstructionType
+}
 
 
 def build_prompt(
@@ -24,6 +30,6 @@ def build_prompt(
     Returns:
         Formatted prompt string ready for LLM input
     """
-    prompt_template: str = PromptTemplate[instruction_type.name].value
-    search_json: str = json.dumps(search_results)
+    prompt_template: str = _PROMPT_TEMPLATES[instruction_type]
+    search_json: str = to_json(search_results).decode()
     return prompt_template.format(question=question, context=search_json)
@@ -1,10 +1,19 @@
 # Document search utilities
-from typing import Any, Dict, List
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
 
 from config import (
     PodcastConstants,
 )
 
+SEARCH_CACHE_MAXSIZE = 256  # Cached questions per index
+
+# Attributes holding an index's fitted data: minsearch Index.fit rebinds docs,
+# VectorIndex._build_index rebinds embeddings
+_FITTED_DATA_ATTRS = ("docs", "embeddings")
+
 
 class RAGError(Exception):
     """Base exception for RAG-related errors"""
@@ -12,12 +21,61 @@ class RAGError(Exception):
     pass
 
 
+@dataclass
+class _IndexSearchCache:
+    """Search results cached for one index while its fitted data is unchanged"""
+
+    fitted_data: Tuple[Any, ...]
+    results: Dict[str, Tuple[Dict[str, Any], ...]] = field(default_factory=dict)
+
+
+# Weakly keyed, so a replaced index (and its embeddings) is freed with its cache
+_search_cache: "weakref.WeakKeyDictionary[Any, _IndexSearchCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_search_cache_lock = threading.Lock()
+
+
+def _fitted_data(index: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(index, attr, None) for attr in _FITTED_DATA_ATTRS)
+
+
+def _search_cached(index: Any, question: str) -> Tuple[Dict[str, Any], ...]:
+    """Run the index search once per question until the index is refit"""
+    fitted_data = _fitted_data(index)
+    with _search_cache_lock:
+        entry = _search_cache.get(index)
+        # Compare by identity: refitting rebinds the fitted data attributes
+        if entry is None or any(
+            cached is not current
+            for cached, current in zip(entry.fitted_data, fitted_data)
+        ):
+            entry = _IndexSearchCache(fitted_data)
+            _search_cache[index] = entry
+        results = entry.results.get(question)
+    if results is not None:
+        return results
+
+    results = tuple(
+        index.search(
+            question,
+            num_results=PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value,
+        )
+    )
+    with _search_cache_lock:
+        if len(entry.results) >= SEARCH_CACHE_MAXSIZE:
+            # Evict the oldest question
+            entry.results.pop(next(iter(entry.results)))
+        entry.results[question] = results
+    return results
+
+
 def search_documents(question: str, index: Any | None = None) -> List[Dict[str, Any]]:
     """
     Search for relevant documents using the provided search index.
 
     Supports both text-based search (Minsearch) and vector-based search (SentenceTransformers).
-    Automatically detects the index type and uses the appropriate search method.
+    Results are cached per index and question until the index is refit.
 
     Args:
         question: The search query/question to find relevant documents for
@@ -37,19 +95,10 @@ def search_documents(question: str, index: Any | None = None) -> List[Dict[str,
         if index is None:
             raise RAGError("Search index is required")
 
-        # Check if it's a vector index by checking the class name
-        if hasattr(index, "__class__") and "VectorIndex" in str(index.__class__):
-            # Vector search (query, num_results)
-            results = index.search(
-                question,
-                num_results=PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value,
-            )
-        else:
-            # Text search (minsearch) - simplified without boost/filter dicts
-            results = index.search(
-                question,
-                num_results=PodcastConstants.DEFAULT_SEARCH_RESULTS_LIMIT.value,
-            )
+        # Text (minsearch) and vector indexes share the search(query, num_results)
+        # interface, so both go through the same cached lookup. Copy each result
+        # so callers mutating them cannot alter what later cache hits return
+        results = [dict(result) for result in _search_cached(index, question)]
 
         if not results:
             raise RAGError("No documents found for the given question")
@@ -0,0 +1,5 @@
+import os
+
+# config builds the shared OpenAI clients at import, which requires a key;
+# tests never reach the API, so any placeholder will do
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,158 @@
+"""Tests for the RAG query entry points"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from prompt import llm_utils
+from prompt.llm_utils import (
+    query_with_context,
+    query_with_context_async,
+    query_with_context_batch,
+    query_with_context_stream,
+)
+from prompt.models import RAGAnswer
+from prompt.search_utils import RAGError
+
+TEST_QUESTIONS = [f"Question {i}?" for i in range(6)]
+TEST_SOURCE = "episode-1.md"
+
+
+class StubIndex:
+    """Index returning one document that echoes the question"""
+
+    def search(self, question, num_results):
+        return [{"content": question, "filename": TEST_SOURCE}]
+
+
+def _answer(text: str) -> RAGAnswer:
+    return RAGAnswer(answer=text, confidence=0.9, sources_used=[TEST_SOURCE])
+
+
+def _question_from(messages) -> str:
+    """Pull the question back out of the built user prompt"""
+    return messages[0]["content"].split("<QUESTION>\n")[1].split("\n</QUESTION>")[0]
+
+
+class StubClient:
+    """Sync client whose parse answers with the question it was asked"""
+
+    def __init__(self):
+        self.responses = SimpleNamespace(parse=self.parse)
+
+    def parse(self, model, input, text_format, prompt_cache_key):
+        return SimpleNamespace(output_parsed=_answer(_question_from(input)))
+
+
+class FailingParseAsyncClient:
+    """Async client whose structured parse fails, forcing the fallback"""
+
+    def __init__(self):
+        self.create_calls = 0
+        self.responses = SimpleNamespace(parse=self.parse, create=self.create)
+
+    async def parse(self, **kwargs):
+        raise RuntimeError("structured output unavailable")
+
+    async def create(self, model, input):
+        self.create_calls += 1
+        return SimpleNamespace(output_text="Fallback answer. Confidence: 0.7")
+
+
+class StubStream:
+    """Async context manager yielding pre-canned response stream events"""
+
+    def __init__(self, events):
+        self._events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def __aiter__(self):
+        for event in self._events:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def _stream_client(events) -> SimpleNamespace:
+    return SimpleNamespace(
+        responses=SimpleNamespace(stream=lambda **kwargs: StubStream(events))
+    )
+
+
+def _delta(text: str) -> SimpleNamespace:
+    return SimpleNamespace(type="response.output_text.delta", delta=text)
+
+
+async def _collect(stream) -> list[str]:
+    return [chunk async for chunk in stream]
+
+
+def test_query_uses_shared_client_by_default(monkeypatch):
+    """Test query_with_context falls back to the pooled client from config"""
+    monkeypatch.setattr(llm_utils, "default_openai_client", StubClient())
+
+    answer = query_with_context("What is MLOps?", StubIndex())
+
+    assert answer.answer == "What is MLOps?"
+
+
+def test_batch_returns_answers_in_input_order():
+    """Test batch results line up with the questions they answer"""
+    answers = query_with_context_batch(
+        TEST_QUESTIONS, StubIndex(), StubClient(), max_workers=3
+    )
+
+    assert [a.answer for a in answers] == TEST_QUESTIONS
+
+
+def test_batch_returns_error_in_place_of_failed_question():
+    """Test one failing question leaves the other answers intact"""
+    questions = ["First?", "   ", "Third?"]
+
+    results = query_with_context_batch(questions, StubIndex(), StubClient())
+
+    assert results[0].answer == "First?"
+    assert isinstance(results[1], RAGError)
+    assert results[2].answer == "Third?"
+
+
+def test_stream_yields_text_deltas():
+    """Test only output text deltas are yielded, in order"""
+    client = _stream_client(
+        [_delta("Hello"), SimpleNamespace(type="response.created"), _delta(" world")]
+    )
+
+    chunks = asyncio.run(
+        _collect(query_with_context_stream("Greeting?", StubIndex(), client))
+    )
+
+    assert chunks == ["Hello", " world"]
+
+
+def test_stream_wraps_failures_in_rag_error():
+    """Test errors raised mid-stream surface as RAGError"""
+    client = _stream_client([_delta("Hel"), RuntimeError("connection reset")])
+
+    with pytest.raises(RAGError, match="connection reset"):
+        asyncio.run(
+            _collect(query_with_context_stream("Greeting?", StubIndex(), client))
+        )
+
+
+def test_async_fallback_uses_passed_client():
+    """Test the fallback after a failed parse runs on the caller's client"""
+    client = FailingParseAsyncClient()
+
+    answer = asyncio.run(
+        query_with_context_async("What is MLOps?", StubIndex(), client)
+    )
+
+    assert client.create_calls == 1
+    assert answer.answer == "Fallback answer. Confidence: 0.7"
+    assert answer.confidence == 0.7
+    assert answer.sources_used == [TEST_SOURCE]
@@ -0,0 +1,67 @@
+"""Tests for the per-index search cache"""
+
+import gc
+import weakref
+
+from prompt import search_utils
+from prompt.search_utils import search_documents
+
+TEST_QUESTION = "What is MLOps?"
+
+
+class CountingIndex:
+    """Index that counts searches and can be refit like minsearch's Index"""
+
+    def __init__(self, docs):
+        self.searches = 0
+        self.fit(docs)
+
+    def fit(self, docs):
+        self.docs = docs
+
+    def search(self, question, num_results):
+        self.searches += 1
+        return [dict(doc) for doc in self.docs]
+
+
+def test_repeated_question_searches_index_once():
+    """Test a repeated question is served from the cache"""
+    index = CountingIndex([{"content": "a"}])
+
+    search_documents(TEST_QUESTION, index)
+    search_documents(TEST_QUESTION, index)
+
+    assert index.searches == 1
+
+
+def test_mutating_results_does_not_change_cache():
+    """Test callers get copies of the cached result dicts"""
+    index = CountingIndex([{"content": "a"}])
+
+    search_documents(TEST_QUESTION, index)[0]["content"] = "mutated"
+
+    assert search_documents(TEST_QUESTION, index) == [{"content": "a"}]
+
+
+def test_refit_index_is_searched_again():
+    """Test refitting an index drops its cached results"""
+    index = CountingIndex([{"content": "old"}])
+    search_documents(TEST_QUESTION, index)
+
+    index.fit([{"content": "new"}])
+
+    assert search_documents(TEST_QUESTION, index) == [{"content": "new"}]
+    assert index.searches == 2
+
+
+def test_cache_does_not_keep_index_alive():
+    """Test a dropped index is freed together with its cache entry"""
+    index = CountingIndex([{"content": "a"}])
+    search_documents(TEST_QUESTION, index)
+    assert index in search_utils._search_cache
+    index_ref = weakref.ref(index)
+
+    del index
+    gc.collect()
+
+    assert index_ref() is None
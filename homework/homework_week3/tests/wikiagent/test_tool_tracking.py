@@ -0,0 +1,62 @@
+"""Tests for per-query tool call tracking"""
+
+import asyncio
+import json
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ToolReturnPart
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from wikiagent.models import SearchAgentAnswer
+from wikiagent.wikipagent import query_wikipedia
+
+NUM_CONCURRENT_QUERIES = 8
+
+
+def _build_agent(num_tool_calls: int) -> Agent:
+    """Agent that calls the lookup tool a fixed number of times, then answers"""
+
+    async def stream_model(messages, info):
+        tool_returns = sum(
+            isinstance(part, ToolReturnPart)
+            for message in messages
+            for part in message.parts
+        )
+        if tool_returns < num_tool_calls:
+            args = json.dumps({"query": f"lookup {tool_returns}"})
+            yield {0: DeltaToolCall("lookup", args)}
+        else:
+            answer = {"answer": "done", "confidence": 1.0, "sources_used": []}
+            yield {0: DeltaToolCall(info.output_tools[0].name, json.dumps(answer))}
+
+    agent = Agent(
+        FunctionModel(stream_function=stream_model), output_type=SearchAgentAnswer
+    )
+
+    @agent.tool_plain
+    async def lookup(query: str) -> str:
+        # Yield to the event loop so concurrent queries interleave
+        await asyncio.sleep(0)
+        return query
+
+    return agent
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(10)
+async def test_concurrent_queries_track_their_own_tool_calls():
+    """Test tool calls from concurrent queries never leak into each other"""
+    expected_counts = list(range(1, NUM_CONCURRENT_QUERIES + 1))
+
+    responses = await asyncio.gather(
+        *(
+            query_wikipedia(f"Question {count}?", agent=_build_agent(count))
+            for count in expected_counts
+        )
+    )
+
+    assert [len(r.tool_calls) for r in responses] == expected_counts
+    assert all(
+        call["tool_name"] == "lookup" for r in responses for call in r.tool_calls
+    )
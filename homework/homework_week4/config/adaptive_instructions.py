@@ -1,8 +1,11 @@
 """Adaptive instruction generation based on search mode"""
 
+from functools import cache
+
 from config import SearchMode
 
 
+@cache
 def get_wikipedia_agent_instructions(mode: SearchMode) -> str:
     """
     Generate Wikipedia agent instructions based on search mode.
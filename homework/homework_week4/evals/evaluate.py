@@ -24,6 +24,18 @@ FALLBACK_NUM_TOKENS = 0  # Fallback token count for failed evaluations
 FALLBACK_COMBINED_SCORE = 0.0  # Fallback combined score for failed evaluations
 
 
+def _fallback_result(question: str) -> dict[str, Any]:
+    """Build a result entry with fallback values for a failed evaluation"""
+    return {
+        "question": question,
+        "hit_rate": FALLBACK_HIT_RATE,
+        "mrr": FALLBACK_MRR,
+        "judge_score": FALLBACK_JUDGE_SCORE,
+        "num_tokens": FALLBACK_NUM_TOKENS,
+        "combined_score": FALLBACK_COMBINED_SCORE,
+    }
+
+
 async def evaluate_agent(
     ground_truth_path: str | Path,
     output_path: str | Path = DEFAULT_OUTPUT_PATH,
@@ -70,15 +82,26 @@ async def evaluate_agent(
         )
 
         try:
-            agent_result = await query_wikipedia(question, search_mode=search_mode)
+            # Every evaluation must run the agent: cached responses would
+            # repeat earlier token usage and hide run-to-run variation
+            agent_result = await query_wikipedia(
+                question, search_mode=search_mode, use_cache=False
+            )
+
+            # Skip scoring (and the judge call) when the agent produced no answer
+            answer = agent_result.answer
+            if answer is None or not answer.answer:
+                logger.warning(f"Question {i} produced no answer, skipping scoring")
+                results.append(_fallback_result(question))
+                continue
 
-            actual_sources = agent_result.answer.sources_used or []
+            actual_sources = answer.sources_used or []
             hit_rate = calculate_hit_rate(expected_sources, actual_sources)
             mrr = calculate_mrr(expected_sources, actual_sources)
 
             judge_result = await evaluate_answer(
                 question,
-                agent_result.answer,
+                answer,
                 tool_calls=agent_result.tool_calls,
                 judge_model=judge_model,
             )
@@ -117,16 +140,7 @@ async def evaluate_agent(
         except Exception as e:
             logger.error(f"Error evaluating question {i}: {e}")
             # Store failed result with fallback values
-            results.append(
-                {
-                    "question": question,
-                    "hit_rate": FALLBACK_HIT_RATE,
-                    "mrr": FALLBACK_MRR,
-                    "judge_score": FALLBACK_JUDGE_SCORE,
-                    "num_tokens": FALLBACK_NUM_TOKENS,
-                    "combined_score": FALLBACK_COMBINED_SCORE,
-                }
-            )
+            results.append(_fallback_result(question))
 
     # Prepare metadata
     metadata: dict[str, Any] = {
@@ -0,0 +1,44 @@
+"""Tests for batched Wikipedia queries"""
+
+import asyncio
+import json
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from wikiagent.models import SearchAgentAnswer
+from wikiagent.wikipagent import query_wikipedia_batch
+
+TEST_QUESTIONS = [f"Question {i}?" for i in range(6)]
+TEST_CONCURRENCY = 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_batch_returns_one_response_per_question_in_order():
+    """Test batch results keep input order and never exceed the concurrency limit"""
+    in_flight = 0
+    peak = 0
+
+    # query_wikipedia runs with an event stream handler, so the model must stream
+    async def slow_model(messages, info):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        question = messages[0].parts[-1].content
+        answer = {"answer": question, "confidence": 1.0, "sources_used": []}
+        yield {0: DeltaToolCall(info.output_tools[0].name, json.dumps(answer))}
+
+    agent = Agent(
+        FunctionModel(stream_function=slow_model), output_type=SearchAgentAnswer
+    )
+
+    responses = await query_wikipedia_batch(
+        TEST_QUESTIONS, agent=agent, concurrency=TEST_CONCURRENCY
+    )
+
+    assert [r.answer.answer for r in responses] == TEST_QUESTIONS
+    assert peak == TEST_CONCURRENCY
@@ -0,0 +1,34 @@
+"""Tests for agent error classification"""
+
+import pytest
+
+from wikiagent.wikipagent import _handle_error
+
+
+@pytest.mark.parametrize(
+    "exception, expected_type",
+    [
+        (RuntimeError("Failed to search Wikipedia: 503"), "WikipediaAPI"),
+        (RuntimeError("HTTP connection reset"), "WikipediaAPI"),
+        (ConnectionError("reset by peer"), "Network"),
+        (RuntimeError("connection refused"), "Network"),
+        (TimeoutError("read"), "Timeout"),
+        (TimeoutError("connection lost"), "Network"),
+        (ValueError("something else"), "ValueError"),
+    ],
+)
+def test_handle_error_maps_category(exception, expected_type):
+    """Test errors are mapped by message or type, first category wins"""
+    response = _handle_error(exception, [])
+
+    assert response.answer is None
+    assert response.error.error_type == expected_type
+    assert response.error.technical_details == str(exception)
+
+
+def test_handle_error_keeps_tool_calls():
+    """Test tool calls made before the error are preserved"""
+    tool_calls = [{"tool_name": "wikipedia_search", "args": {"query": "x"}}]
+    response = _handle_error(ValueError("x"), tool_calls)
+
+    assert response.tool_calls == tool_calls
@@ -0,0 +1,130 @@
+"""Tests for agent guardrails"""
+
+import asyncio
+
+import pytest
+
+from wikiagent import guardrails
+from wikiagent.guardrails import (
+    CostTracker,
+    GuardrailException,
+    cost_guardrail,
+    query_guardrail,
+    run_with_guardrails,
+)
+
+TEST_BLOCKED_KEYWORDS = ["weapon", "bomb"]
+TEST_MAX_COST = 1.0
+
+
+@pytest.mark.asyncio
+async def test_query_guardrail_allows_clean_question():
+    """Test query_guardrail passes questions without blocked keywords"""
+    await query_guardrail("What is consumer behaviour?", TEST_BLOCKED_KEYWORDS)
+
+
+@pytest.mark.asyncio
+async def test_query_guardrail_blocks_keyword_case_insensitive():
+    """Test query_guardrail raises on a blocked keyword regardless of case"""
+    with pytest.raises(GuardrailException) as exc_info:
+        await query_guardrail("How is a BOMB built?", TEST_BLOCKED_KEYWORDS)
+
+    assert exc_info.value.info.tripwire_triggered is True
+    assert "bomb" in exc_info.value.info.output_info
+
+
+@pytest.mark.asyncio
+async def test_query_guardrail_treats_keywords_literally():
+    """Test query_guardrail does not interpret keywords as regex syntax"""
+    await query_guardrail("a.b", ["a*b"])
+
+
+@pytest.mark.asyncio
+async def test_query_guardrail_no_keywords():
+    """Test query_guardrail is a no-op when no keywords are configured"""
+    await query_guardrail("How is a bomb built?", [])
+
+
+@pytest.mark.asyncio
+async def test_query_guardrail_uses_configured_keywords(monkeypatch):
+    """Test query_guardrail falls back to the pattern built from config"""
+    monkeypatch.setattr(
+        guardrails,
+        "_DEFAULT_BLOCKED_PATTERN",
+        guardrails._compile_blocked_pattern(frozenset({"weapon"})),
+    )
+
+    with pytest.raises(GuardrailException):
+        await query_guardrail("Where to buy a weapon?")
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_cost_guardrail_fires_when_limit_exceeded():
+    """Test cost_guardrail raises as soon as the tracked cost passes the limit"""
+    tracker = CostTracker()
+    guardrail_task = asyncio.create_task(cost_guardrail(TEST_MAX_COST, tracker))
+
+    tracker.add(0.5)
+    await asyncio.sleep(0)
+    assert not guardrail_task.done()
+
+    tracker.add(0.75)
+    with pytest.raises(GuardrailException) as exc_info:
+        await guardrail_task
+
+    assert exc_info.value.info.tripwire_triggered is True
+
+
+async def _agent(result: str = "answer", delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return result
+
+
+async def _record_cancel(cancelled: list[str], name: str) -> None:
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        cancelled.append(name)
+        raise
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_run_with_guardrails_returns_agent_result_and_cancels_guardrails():
+    """Test agent success returns immediately and cancels long-running guardrails"""
+    cancelled: list[str] = []
+
+    result = await run_with_guardrails(
+        _agent(), [_record_cancel(cancelled, "guardrail")]
+    )
+
+    assert result == "answer"
+    assert cancelled == ["guardrail"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_run_with_guardrails_waits_for_agent_after_passing_guardrail():
+    """Test a guardrail that passes and returns does not end the run early"""
+    result = await run_with_guardrails(
+        _agent(delay=0.01),
+        [query_guardrail("What is consumer behaviour?", TEST_BLOCKED_KEYWORDS)],
+    )
+
+    assert result == "answer"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_run_with_guardrails_raises_and_cancels_agent():
+    """Test a triggered guardrail raises and cancels the running agent"""
+    cancelled: list[str] = []
+
+    with pytest.raises(GuardrailException):
+        await run_with_guardrails(
+            _record_cancel(cancelled, "agent"),
+            [query_guardrail("How is a bomb built?", TEST_BLOCKED_KEYWORDS)],
+        )
+
+    assert cancelled == ["agent"]
@@ -0,0 +1,124 @@
+"""Tests for the monitoring database write and read path (SQLite-backed)"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from wikiagent.models import TokenUsage
+from wikiagent.monitoring import db
+from wikiagent.monitoring.schemas import (
+    EvalCheckCreate,
+    GuardrailEventCreate,
+    LogCreate,
+    LogResponse,
+    LogSummaryResponse,
+)
+
+TEST_QUESTION = "What is consumer behaviour?"
+TEST_ANSWER = "The study of how people choose and use products."
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """Point the monitoring module at a fresh SQLite database"""
+    monkeypatch.setattr(db, "DATABASE_URL", f"sqlite:///{tmp_path / 'monitoring.db'}")
+    monkeypatch.setattr(db, "_cost_stats_cache", None)
+    db._get_engine.cache_clear()
+    db._get_session_factory.cache_clear()
+    db.init_db()
+    yield
+    engine = db._get_engine()
+    if engine is not None:
+        engine.dispose()
+    db._get_engine.cache_clear()
+    db._get_session_factory.cache_clear()
+
+
+def _insert_test_log() -> int:
+    """Insert a log, one eval check and one guardrail event; return the log id"""
+    log_data = LogCreate(
+        agent_name="wikipedia_agent",
+        provider="openai",
+        model="gpt-4o-mini",
+        user_prompt=TEST_QUESTION,
+        instructions="Answer using Wikipedia.",
+        total_input_tokens=120,
+        total_output_tokens=40,
+        assistant_answer=TEST_ANSWER,
+        # Log entries carry datetimes and pydantic models, not just JSON values
+        raw_json={
+            "timestamp": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "usage": TokenUsage(input_tokens=120, output_tokens=40, total_tokens=160),
+        },
+        input_cost=0.001,
+        output_cost=0.002,
+        total_cost=0.003,
+    )
+    with db.get_db() as session:
+        log_id = db.insert_log(session, **log_data.model_dump())
+        check = EvalCheckCreate(
+            log_id=log_id, check_name="answer_relevant", passed=True, score=1.0
+        )
+        event = GuardrailEventCreate(
+            log_id=log_id, guardrail_name="query_guardrail", triggered=False
+        )
+        db.bulk_insert_eval_checks(session, [check.model_dump()])
+        db.bulk_insert_guardrail_events(session, [event.model_dump()])
+    return log_id
+
+
+def test_insert_log_stores_non_json_raw_values(sqlite_db):
+    """Test raw_json with datetimes and models is serialized and stored"""
+    log_id = _insert_test_log()
+
+    with db.get_db() as session:
+        raw_json = session.get(db.LLMLog, log_id).raw_json
+
+    assert raw_json["timestamp"] == "2025-01-01 00:00:00+00:00"
+    assert raw_json["usage"] == {
+        "input_tokens": 120,
+        "output_tokens": 40,
+        "total_tokens": 160,
+    }
+
+
+def test_recent_logs_match_summary_schema(sqlite_db):
+    """Test get_recent_logs returns exactly the LogSummaryResponse fields"""
+    log_id = _insert_test_log()
+
+    (log,) = db.get_recent_logs()
+
+    assert log.keys() == LogSummaryResponse.model_fields.keys()
+    summary = LogSummaryResponse(**log)
+    assert summary.id == log_id
+    assert summary.user_prompt == TEST_QUESTION
+    assert summary.created_at is not None
+
+
+def test_log_with_checks_matches_response_schema(sqlite_db):
+    """Test get_log_with_checks returns the LogResponse fields and relations"""
+    log_id = _insert_test_log()
+
+    log = db.get_log_with_checks(log_id)
+
+    assert log.keys() == LogResponse.model_fields.keys()
+    response = LogResponse(**log)
+    assert response.assistant_answer == TEST_ANSWER
+    assert [c.check_name for c in response.checks] == ["answer_relevant"]
+    assert [e.guardrail_name for e in response.guardrail_events] == ["query_guardrail"]
+
+
+def test_cost_stats_include_rows_committed_out_of_id_order(sqlite_db):
+    """Test a log with a lower id committing late still refreshes cached stats"""
+    with db.get_db() as session:
+        db.insert_log(session, id=1, total_cost=1.0)
+        db.insert_log(session, id=3, total_cost=1.0)
+    assert db.get_cost_stats()["total_queries"] == 2
+
+    # MAX(id) is unchanged by this insert; only the row count moves
+    with db.get_db() as session:
+        db.insert_log(session, id=2, total_cost=1.0)
+
+    stats = db.get_cost_stats()
+    assert stats["total_queries"] == 3
+    assert stats["total_cost"] == 3.0
@@ -0,0 +1,84 @@
+"""Tests for the query_wikipedia response cache"""
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from config import SearchMode
+from wikiagent import wikipagent
+from wikiagent.models import SearchAgentAnswer
+from wikiagent.wikipagent import query_wikipedia
+
+TEST_QUESTION = "What is consumer behaviour?"
+TEST_MODEL_NAME = "test-model"
+
+
+@pytest.fixture
+def counting_agent(monkeypatch):
+    """Patch the default agent with a TestModel agent and count its builds"""
+    created = []
+
+    def fake_create_agent(openai_model, search_mode):
+        created.append((openai_model, search_mode))
+        return Agent(TestModel(call_tools=[]), output_type=SearchAgentAnswer)
+
+    monkeypatch.setattr(wikipagent, "_create_agent", fake_create_agent)
+    monkeypatch.setattr(wikipagent, "_response_cache", wikipagent.OrderedDict())
+    return created
+
+
+@pytest.mark.asyncio
+async def test_repeated_question_is_served_from_cache(counting_agent):
+    """Test the same question, model and mode runs the agent only once"""
+    first = await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION)
+    second = await query_wikipedia(
+        TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION
+    )
+
+    assert len(counting_agent) == 1
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_cache_is_keyed_on_search_mode(counting_agent):
+    """Test a different search mode is not served from another mode's entry"""
+    await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION)
+    await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.PRODUCTION)
+
+    assert len(counting_agent) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_refreshed(counting_agent, monkeypatch):
+    """Test entries older than the TTL are dropped and recomputed"""
+    await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION)
+    monkeypatch.setattr(wikipagent, "RESPONSE_CACHE_TTL", -1)
+    await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION)
+
+    assert len(counting_agent) == 2
+
+
+@pytest.mark.asyncio
+async def test_custom_agent_bypasses_cache(counting_agent):
+    """Test queries with an explicit agent are neither cached nor served from cache"""
+    agent = Agent(TestModel(call_tools=[]), output_type=SearchAgentAnswer)
+
+    await query_wikipedia(TEST_QUESTION, agent=agent)
+
+    assert len(wikipagent._response_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_always_runs_agent(counting_agent):
+    """Test use_cache=False neither reads nor fills the cache"""
+    await query_wikipedia(TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION)
+    await query_wikipedia(
+        TEST_QUESTION, TEST_MODEL_NAME, SearchMode.EVALUATION, use_cache=False
+    )
+    await query_wikipedia(
+        TEST_QUESTION, TEST_MODEL_NAME, SearchMode.PRODUCTION, use_cache=False
+    )
+
+    assert len(counting_agent) == 3
+    assert len(wikipagent._response_cache) == 1
@@ -0,0 +1,108 @@
+"""Tests for streaming output helpers"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from wikiagent.models import SearchAgentAnswer
+from wikiagent.wikipagent import (
+    _is_structured_output,
+    _process_streaming_part,
+    query_wikipedia_stream,
+)
+
+TEST_ANSWER = {"answer": "Consumer behaviour", "confidence": 0.9, "sources_used": []}
+
+
+@pytest.mark.parametrize(
+    "args_str, expected",
+    [
+        ('{"answer": "Consumer behaviour is', True),
+        ('{"Confidence": 0.9', True),
+        ('{"sources_used": ["Consumer behaviour"]', True),
+        ('{"query": "consumer behaviour"}', False),
+        ("", False),
+    ],
+)
+def test_is_structured_output(args_str, expected):
+    """Test structured output is detected by any field name, ignoring case"""
+    assert _is_structured_output(args_str) is expected
+
+
+def test_process_streaming_part_emits_only_new_text():
+    """Test each structured output chunk forwards just the text past the offset"""
+    chunks = [
+        '{"answer": "Cons',
+        '{"answer": "Consumer beh',
+        '{"answer": "Consumer beh',
+    ]
+    deltas: list[str] = []
+    previous_len = 0
+
+    for args in chunks:
+        part = SimpleNamespace(tool_name="final_result", args=args)
+        previous_len, handled = _process_streaming_part(
+            part, None, deltas.append, previous_len
+        )
+        assert handled is True
+
+    assert deltas == ['{"answer": "Cons', "umer beh"]
+    assert previous_len == len(chunks[-1])
+
+
+def test_process_streaming_part_forwards_tool_calls():
+    """Test Wikipedia tool calls go to the tool callback and keep the offset"""
+    calls: list[tuple[str, str]] = []
+    part = SimpleNamespace(tool_name="wikipedia_search", args='{"query": "x"}')
+
+    previous_len, handled = _process_streaming_part(
+        part, lambda name, args: calls.append((name, args)), None, 7
+    )
+
+    assert (previous_len, handled) == (7, True)
+    assert calls == [("wikipedia_search", '{"query": "x"}')]
+
+
+def _build_streaming_agent() -> Agent:
+    """Agent whose final answer arrives in two streamed chunks"""
+
+    async def stream_model(messages, info):
+        answer = json.dumps(TEST_ANSWER)
+        name = info.output_tools[0].name
+        yield {0: DeltaToolCall(name, answer[:10])}
+        yield {0: DeltaToolCall(json_args=answer[10:])}
+
+    return Agent(
+        FunctionModel(stream_function=stream_model), output_type=SearchAgentAnswer
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_query_wikipedia_stream_forwards_structured_output():
+    """Test streamed deltas add up to the final structured answer"""
+    deltas: list[str] = []
+
+    response = await query_wikipedia_stream(
+        "What is consumer behaviour?",
+        structured_output_callback=deltas.append,
+        agent=_build_streaming_agent(),
+    )
+
+    assert response.answer.answer == TEST_ANSWER["answer"]
+    assert json.loads("".join(deltas)) == TEST_ANSWER
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_query_wikipedia_stream_without_callbacks():
+    """Test the stream still returns the answer when no callbacks are registered"""
+    response = await query_wikipedia_stream(
+        "What is consumer behaviour?", agent=_build_streaming_agent()
+    )
+
+    assert response.error is None
+    assert response.answer.answer == TEST_ANSWER["answer"]
@@ -0,0 +1,84 @@
+"""Tests for tool call tracking"""
+
+import asyncio
+
+import pytest
+from pydantic_ai.messages import (
+    FunctionToolCallEvent,
+    PartStartEvent,
+    TextPart,
+    ToolCallPart,
+)
+
+from wikiagent import wikipagent
+from wikiagent.config import MAX_TOOL_CALL_ARGS_LENGTH
+from wikiagent.wikipagent import _create_tool_call_tracker, _parse_tool_args
+
+LONG_ARGS = '{"query": "' + "x" * (2 * MAX_TOOL_CALL_ARGS_LENGTH) + '"}'
+
+
+def _track(events, **kwargs) -> list[dict]:
+    """Feed events through a fresh tracker and return the recorded tool calls"""
+    tool_calls: list[dict] = []
+    tracker = _create_tool_call_tracker(tool_calls, **kwargs)
+
+    async def stream():
+        for event in events:
+            yield event
+
+    asyncio.run(tracker(None, stream()))
+    return tool_calls
+
+
+def _tool_call(args: str) -> FunctionToolCallEvent:
+    return FunctionToolCallEvent(part=ToolCallPart("wikipedia_search", args))
+
+
+def test_tracker_records_only_tool_calls():
+    """Test non tool-call events in the stream are ignored"""
+    tool_calls = _track([PartStartEvent(index=0, part=TextPart("x")), _tool_call("{}")])
+
+    assert tool_calls == [
+        {"tool_name": "wikipedia_search", "args": "{}", "truncated": False}
+    ]
+
+
+def test_tracker_truncates_long_args():
+    """Test oversized raw args are cut and flagged"""
+    (tool_call,) = _track([_tool_call(LONG_ARGS)])
+
+    assert tool_call["truncated"] is True
+    assert tool_call["args"] == LONG_ARGS[:MAX_TOOL_CALL_ARGS_LENGTH]
+
+
+def test_tracker_keeps_full_args_when_requested():
+    """Test store_full_args keeps the raw args untouched"""
+    (tool_call,) = _track([_tool_call(LONG_ARGS)], store_full_args=True)
+
+    assert tool_call["truncated"] is False
+    assert tool_call["args"] == LONG_ARGS
+
+
+def test_tracker_caps_number_of_tool_calls(monkeypatch):
+    """Test tool calls beyond MAX_TOOL_CALLS are not stored"""
+    monkeypatch.setattr(wikipagent, "MAX_TOOL_CALLS", 2)
+
+    tool_calls = _track([_tool_call("{}") for _ in range(5)])
+
+    assert len(tool_calls) == 2
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ({"query": "consumer behaviour"}, "consumer behaviour"),
+        ('{"query": "consumer behaviour"}', "consumer behaviour"),
+        ({"title": "Consumer behaviour"}, "N/A"),
+        ("not json", "not json"),
+        ("", "N/A"),
+        (None, "None"),
+    ],
+)
+def test_parse_tool_args(args, expected):
+    """Test the display query is extracted from dict, JSON string and other args"""
+    assert _parse_tool_args(args) == expected
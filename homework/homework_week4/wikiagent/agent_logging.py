@@ -1,9 +1,9 @@
-import json
+import asyncio
 import logging
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, fields
 from typing import Any
 
-import pydantic
 from genai_prices import Usage, calc_price
 from pydantic import BaseModel
 from pydantic_ai import Agent
@@ -11,9 +11,13 @@ from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
 from pydantic_ai.result import StreamedRunResult
 from pydantic_ai.usage import RunUsage
 
+from wikiagent.monitoring.db import get_db, insert_log
+from wikiagent.monitoring.schemas import LogCreate
+
 logger = logging.getLogger(__name__)
 
-UsageTypeAdapter = pydantic.TypeAdapter(RunUsage)
+# RunUsage is a plain dataclass; copy its fields directly instead of via TypeAdapter
+_USAGE_FIELDS = tuple(f.name for f in fields(RunUsage))
 
 
 @dataclass
@@ -26,6 +30,36 @@ class CostResult:
     error: str | None = None
 
 
+@dataclass(frozen=True)
+class _AgentInfo:
+    """Static agent attributes recorded with every log entry."""
+
+    name: str | None
+    provider: str | None
+    model: str | None
+    tools: tuple[str, ...]
+
+
+# Keyed by id(agent): Agent is unhashable, entries are evicted when the agent dies
+_AGENT_INFO_CACHE: dict[int, _AgentInfo] = {}
+
+
+def _get_agent_info(agent: Agent) -> _AgentInfo:
+    """Return cached static attributes of an agent, computing them on first use."""
+    key = id(agent)
+    info = _AGENT_INFO_CACHE.get(key)
+    if info is None:
+        info = _AgentInfo(
+            name=agent.name,
+            provider=agent.model.system,
+            model=agent.model.model_name,
+            tools=tuple(name for ts in agent.toolsets for name in ts.tools),
+        )
+        _AGENT_INFO_CACHE[key] = info
+        weakref.finalize(agent, _AGENT_INFO_CACHE.pop, key, None)
+    return info
+
+
 def _create_log_entry(
     agent: Agent,
     messages: list[ModelMessage],
@@ -44,19 +78,17 @@ def _create_log_entry(
     Returns:
         Dictionary containing log entry data
     """
-    tools = []
-    for ts in agent.toolsets:
-        tools.extend(ts.tools.keys())
+    info = _get_agent_info(agent)
 
     dict_messages = ModelMessagesTypeAdapter.dump_python(messages)
-    dict_usage = UsageTypeAdapter.dump_python(usage)
+    dict_usage = {name: getattr(usage, name) for name in _USAGE_FIELDS}
 
     return {
-        "agent_name": agent.name,
+        "agent_name": info.name,
         "system_prompt": agent._instructions,
-        "provider": agent.model.system,
-        "model": agent.model.model_name,
-        "tools": tools,
+        "provider": info.provider,
+        "model": info.model,
+        "tools": info.tools,
         "messages": dict_messages,
         "usage": dict_usage,
         "output": output,
@@ -137,6 +169,24 @@ def _calc_cost(
         return CostResult(None, None, None, error=error_msg)
 
 
+def _persist_log(log_data: Any) -> int | None:
+    """
+    Insert a validated log record (blocking, run off the event loop).
+
+    Args:
+        log_data: Validated LogCreate instance
+
+    Returns:
+        Log ID if successful, None otherwise
+    """
+    with get_db() as db:
+        if not db:
+            logger.warning("Database not available, skipping log save")
+            return None
+
+        return insert_log(db, **log_data.model_dump())
+
+
 async def save_log_to_db(
     agent: Agent,
     result: StreamedRunResult,
@@ -154,9 +204,6 @@ async def save_log_to_db(
         Log ID if successful, None otherwise
     """
     try:
-        from wikiagent.monitoring.db import get_db, insert_log
-        from wikiagent.monitoring.schemas import LogCreate
-
         log_entry = await _log_agent_run(agent, result)
         usage = result.usage()
 
@@ -184,18 +231,15 @@ async def save_log_to_db(
             total_input_tokens=usage.input_tokens,
             total_output_tokens=usage.output_tokens,
             assistant_answer=answer_text,
-            raw_json=json.dumps(log_entry, default=str),
+            raw_json=log_entry,
             input_cost=cost_result.input_cost,
             output_cost=cost_result.output_cost,
             total_cost=cost_result.total_cost,
         )
 
-        with get_db() as db:
-            if not db:
-                logger.warning("Database not available, skipping log save")
-                return None
-
-            log_id = insert_log(db, **log_data.model_dump())
+        log_id = await asyncio.to_thread(_persist_log, log_data)
+        if log_id is None:
+            return None
 
         logger.info(f"Saved log to database with ID: {log_id}")
         return log_id
@@ -1,10 +1,21 @@
 import os
+import re
+import sys
 from enum import StrEnum
+from types import MappingProxyType
 
 USER_AGENT = "WikipediaAgent/1.0 (https://github.com/yourusername/wikipedia-agent)"
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Comma-separated keywords rejected by the query guardrail (normalized and
+# interned once here; unlike literals, strings built from the env are not)
+GUARDRAIL_BLOCKED_KEYWORDS: frozenset[str] = frozenset(
+    sys.intern(kw.strip().lower())
+    for kw in os.getenv("GUARDRAIL_BLOCKED_KEYWORDS", "").split(",")
+    if kw.strip()
+)
+
 
 class ErrorCategory(StrEnum):
     """Error categories for agent error handling"""
@@ -52,30 +63,60 @@ MIN_REASONING_LENGTH = 1
 # Logging constants
 MAX_QUESTION_LOG_LENGTH = 100  # Max length for question in logs
 
+# Tool call tracking constants (bound what responses retain per query)
+MAX_TOOL_CALLS = 64  # Tool calls recorded per query; later calls are not stored
+MAX_TOOL_CALL_ARGS_LENGTH = 2048  # Characters of raw args stored per tool call
+
 # Validation constants
 MIN_QUERY_LENGTH = 1
 MAX_QUERY_LENGTH = 300
 MIN_TITLE_LENGTH = 1
 MAX_TITLE_LENGTH = 255
 
-# Error mappings for agent error handling
-ERROR_MAPPINGS = {
-    ErrorCategory.WIKIPEDIA: {
-        "error_type": "WikipediaAPI",
-        "message": "Wikipedia API error. The page may not exist or the service is temporarily unavailable.",
-        "suggestion": "Try rephrasing your question or asking about a different topic.",
-        "keywords": ["wikipedia", "http"],
-    },
-    ErrorCategory.CONNECTION: {
-        "error_type": "Network",
-        "message": "Connection error. Please check your internet connection.",
-        "suggestion": "The Wikipedia API could not be reached. Please try again in a moment.",
-        "keywords": ["connection"],
-    },
-    ErrorCategory.TIMEOUT: {
-        "error_type": "Timeout",
-        "message": "Request timed out. The Wikipedia API took too long to respond.",
-        "suggestion": "Please try again with a simpler question or check your connection.",
-        "keywords": ["timeout"],
-    },
-}
+# Error mappings for agent error handling (read-only)
+ERROR_MAPPINGS = MappingProxyType(
+    {
+        ErrorCategory.WIKIPEDIA: MappingProxyType(
+            {
+                "error_type": "WikipediaAPI",
+                "message": "Wikipedia API error. The page may not exist or the service is temporarily unavailable.",
+                "suggestion": "Try rephrasing your question or asking about a different topic.",
+                "keywords": ("wikipedia", "http"),
+            }
+        ),
+        ErrorCategory.CONNECTION: MappingProxyType(
+            {
+                "error_type": "Network",
+                "message": "Connection error. Please check your internet connection.",
+                "suggestion": "The Wikipedia API could not be reached. Please try again in a moment.",
+                "keywords": ("connection",),
+            }
+        ),
+        ErrorCategory.TIMEOUT: MappingProxyType(
+            {
+                "error_type": "Timeout",
+                "message": "Request timed out. The Wikipedia API took too long to respond.",
+                "suggestion": "Please try again with a simpler question or check your connection.",
+                "keywords": ("timeout",),
+            }
+        ),
+    }
+)
+
+# (keyword, mapping) pairs in category priority order, built once for error lookup
+ERROR_KEYWORD_INDEX = tuple(
+    (kw, mapping) for mapping in ERROR_MAPPINGS.values() for kw in mapping["keywords"]
+)
+
+# Keyword -> position in ERROR_KEYWORD_INDEX (first occurrence wins)
+ERROR_KEYWORD_PRIORITY = MappingProxyType(
+    {kw: pos for pos, (kw, _) in reversed(list(enumerate(ERROR_KEYWORD_INDEX)))}
+)
+
+# All error keywords in one ASCII case-insensitive pattern, matched in one pass
+# over the raw text. The lookahead reports overlapping hits; alternation order
+# is priority order so the best keyword wins when several start at one offset.
+ERROR_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw, _ in ERROR_KEYWORD_INDEX) + "))",
+    re.IGNORECASE | re.ASCII,
+)
@@ -1,13 +1,16 @@
 import asyncio
 import logging
+import re
+from collections.abc import Collection
 from dataclasses import dataclass
+from functools import lru_cache
 
-logger = logging.getLogger(__name__)
+from wikiagent.config import GUARDRAIL_BLOCKED_KEYWORDS
 
-DEFAULT_COST_CHECK_INTERVAL = 0.5  # seconds
+logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GuardrailFunctionOutput:
     output_info: str
     tripwire_triggered: bool
@@ -21,25 +24,40 @@ class GuardrailException(Exception):
         self.info = info
 
 
+class CostTracker:
+    """Running cost total shared between an agent run and cost_guardrail."""
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._changed = asyncio.Event()
+
+    def add(self, cost: float) -> None:
+        """Add cost and wake the guardrail (call from the event loop thread)."""
+        self.total += cost
+        self._changed.set()
+
+    async def wait_for_change(self) -> None:
+        """Block until add() is called."""
+        await self._changed.wait()
+        self._changed.clear()
+
+
 async def cost_guardrail(
     max_cost: float,
-    cost_tracker: dict,
-    check_interval: float = DEFAULT_COST_CHECK_INTERVAL,
+    cost_tracker: CostTracker,
 ) -> None:
     """
     Monitor cost during execution.
 
     Args:
         max_cost: Maximum allowed cost
-        cost_tracker: Shared dict with 'total' key (updated by agent)
-        check_interval: How often to check (seconds)
+        cost_tracker: Shared CostTracker (updated by agent via add())
 
     Raises:
         GuardrailException if cost exceeds max_cost
     """
     while True:
-        await asyncio.sleep(check_interval)
-        current_cost = cost_tracker.get("total", 0.0)
+        current_cost = cost_tracker.total
         if current_cost > max_cost:
             raise GuardrailException(
                 f"Cost limit exceeded: ${current_cost:.2f} (limit: ${max_cost:.2f})",
@@ -48,35 +66,53 @@ async def cost_guardrail(
                     tripwire_triggered=True,
                 ),
             )
+        await cost_tracker.wait_for_change()
+
+
+@lru_cache(maxsize=32)
+def _compile_blocked_pattern(keywords: frozenset[str]) -> re.Pattern | None:
+    """Compile blocked keywords into a single case-insensitive alternation."""
+    keywords = sorted(kw for kw in keywords if kw)
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Pattern for the configured keywords, resolved once at import
+_DEFAULT_BLOCKED_PATTERN = _compile_blocked_pattern(GUARDRAIL_BLOCKED_KEYWORDS)
 
 
 async def query_guardrail(
     question: str,
-    blocked_keywords: list[str],
+    blocked_keywords: Collection[str] | None = None,
 ) -> None:
     """
     Check query for inappropriate content.
 
     Args:
         question: User's question
-        blocked_keywords: List of keywords to block
+        blocked_keywords: Keywords to block (default: GUARDRAIL_BLOCKED_KEYWORDS)
 
     Raises:
         GuardrailException if blocked keyword found
     """
-    if not blocked_keywords:
+    if blocked_keywords is None:
+        pattern = _DEFAULT_BLOCKED_PATTERN
+    else:
+        pattern = _compile_blocked_pattern(frozenset(blocked_keywords))
+    if pattern is None:
         return
 
-    question_lower = question.lower()
-    for keyword in blocked_keywords:
-        if keyword and keyword.lower() in question_lower:
-            raise GuardrailException(
-                f"Query contains blocked keyword: {keyword}",
-                GuardrailFunctionOutput(
-                    output_info=f"Blocked keyword detected: {keyword}",
-                    tripwire_triggered=True,
-                ),
-            )
+    match = pattern.search(question)
+    if match:
+        keyword = match.group(0).lower()
+        raise GuardrailException(
+            f"Query contains blocked keyword: {keyword}",
+            GuardrailFunctionOutput(
+                output_info=f"Blocked keyword detected: {keyword}",
+                tripwire_triggered=True,
+            ),
+        )
 
 
 async def run_with_guardrails(
@@ -97,23 +133,27 @@ async def run_with_guardrails(
         GuardrailException if any guardrail triggers
     """
     agent_task = asyncio.create_task(agent_coroutine)
-    guardrail_tasks = [asyncio.create_task(g) for g in guardrails]
+    pending = {agent_task, *(asyncio.create_task(g) for g in guardrails)}
 
+    # Wake on whichever finishes first; guardrails that pass and return normally
+    # (e.g. query_guardrail) must not end the run, so keep waiting on the agent
     try:
-        await asyncio.gather(agent_task, *guardrail_tasks)
+        while agent_task in pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for t in done:
+                if t is not agent_task and t.exception() is not None:
+                    raise t.exception()
         return agent_task.result()
 
     except GuardrailException as e:
         logger.warning(f"[guardrail fired] {e.info.output_info}")
-
-        agent_task.cancel()
-        try:
-            await agent_task
-        except asyncio.CancelledError:
+        if not agent_task.done():
             logger.info("[run_with_guardrails] agent cancelled")
+        raise
 
-        for t in guardrail_tasks:
+    finally:
+        for t in pending:
             t.cancel()
-        await asyncio.gather(*guardrail_tasks, return_exceptions=True)
-
-        raise
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -1,22 +1,27 @@
+import json
 import logging
 from contextlib import contextmanager
-from datetime import datetime, timezone
-from functools import wraps
+from functools import cache, partial, wraps
 from typing import Any
 
 from sqlalchemy import (
+    JSON,
     Boolean,
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     create_engine,
     func,
+    insert,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
 
 from wikiagent.config import DATABASE_URL
 
@@ -29,12 +34,22 @@ DEFAULT_LOG_LIMIT = 50
 DEFAULT_TOTAL_COST = 0.0
 DEFAULT_TOTAL_QUERIES = 0
 DEFAULT_AVG_COST = 0.0
+DB_POOL_SIZE = 10  # Persistent connections kept open
+DB_MAX_OVERFLOW = 20  # Extra connections allowed under bursts
+DB_POOL_RECYCLE = 1800  # Seconds before a pooled connection is replaced
+
+# Log entries contain datetimes and other non-JSON values; stringify them
+_json_serializer = partial(json.dumps, default=str)
 
 
 class LLMLog(Base):
     """Main log table for agent executions."""
 
     __tablename__ = "llm_logs"
+    # Serves newest-first listing (and keyset pagination on (created_at, id))
+    __table_args__ = (
+        Index("ix_llm_logs_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True)
     agent_name = Column(String)
@@ -45,11 +60,11 @@ class LLMLog(Base):
     total_input_tokens = Column(Integer)
     total_output_tokens = Column(Integer)
     assistant_answer = Column(Text)
-    raw_json = Column(Text)
+    raw_json = Column(JSON().with_variant(JSONB(), "postgresql"))
     input_cost = Column(Float)
     output_cost = Column(Float)
     total_cost = Column(Float)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     checks = relationship(
         "EvalCheck", back_populates="log", cascade="all, delete-orphan"
@@ -66,13 +81,16 @@ class EvalCheck(Base):
 
     id = Column(Integer, primary_key=True)
     log_id = Column(
-        Integer, ForeignKey("llm_logs.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("llm_logs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     check_name = Column(String, nullable=False)
     passed = Column(Boolean)
     score = Column(Float)
     details = Column(Text)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     log = relationship("LLMLog", back_populates="checks")
 
@@ -84,46 +102,48 @@ class GuardrailEvent(Base):
 
     id = Column(Integer, primary_key=True)
     log_id = Column(
-        Integer, ForeignKey("llm_logs.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("llm_logs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     guardrail_name = Column(String, nullable=False)
     triggered = Column(Boolean, nullable=False)
     reason = Column(Text)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     log = relationship("LLMLog", back_populates="guardrail_events")
 
 
-# Global engine and session factory
-_engine: Any | None = None
-_SessionLocal: Any | None = None
-
-
+@cache
 def _get_engine():
-    """Get or create database engine."""
-    global _engine
-    if _engine is None:
-        if not DATABASE_URL:
-            logger.error("DATABASE_URL not set in environment")
-            return None
-        try:
-            _engine = create_engine(DATABASE_URL)
-            logger.info("Database engine created")
-        except Exception as e:
-            logger.error(f"Failed to create database engine: {e}", exc_info=True)
-            return None
-    return _engine
+    """Create the database engine once per process."""
+    if not DATABASE_URL:
+        logger.error("DATABASE_URL not set in environment")
+        return None
+    try:
+        engine = create_engine(
+            DATABASE_URL,
+            json_serializer=_json_serializer,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+        logger.info("Database engine created")
+        return engine
+    except Exception as e:
+        logger.error(f"Failed to create database engine: {e}", exc_info=True)
+        return None
 
 
+@cache
 def _get_session_factory():
-    """Get or create session factory."""
-    global _SessionLocal
-    if _SessionLocal is None:
-        engine = _get_engine()
-        if not engine:
-            return None
-        _SessionLocal = sessionmaker(bind=engine)
-    return _SessionLocal
+    """Create the session factory once per process."""
+    engine = _get_engine()
+    if not engine:
+        return None
+    return sessionmaker(bind=engine)
 
 
 @contextmanager
@@ -183,6 +203,14 @@ def _handle_db_errors(func):
     return wrapper
 
 
+# Core INSERT ... RETURNING per table, built once: no ORM instance or
+# identity-map bookkeeping on the write path
+_INSERT_STMTS = {
+    model_class: insert(model_class).returning(model_class.id)
+    for model_class in (LLMLog, EvalCheck, GuardrailEvent)
+}
+
+
 def _insert_record(db: Any, model_class: type, **kwargs) -> int | None:
     """Generic function to insert any model record."""
     if not db:
@@ -192,15 +220,32 @@ def _insert_record(db: Any, model_class: type, **kwargs) -> int | None:
         return None
 
     try:
-        record = model_class(**kwargs)
-        db.add(record)
-        db.flush()
-        return record.id
+        return db.execute(_INSERT_STMTS[model_class], kwargs).scalar_one()
     except Exception as e:
         logger.error(f"Failed to insert {model_class.__name__}: {e}", exc_info=True)
         return None
 
 
+def _bulk_insert_records(db: Any, model_class: type, rows: list[dict]) -> int:
+    """Insert many records of one model in a single executemany round-trip."""
+    if not db:
+        logger.warning(
+            f"Database session not available, cannot insert {model_class.__name__}"
+        )
+        return 0
+    if not rows:
+        return 0
+
+    try:
+        db.execute(insert(model_class), rows)
+        return len(rows)
+    except Exception as e:
+        logger.error(
+            f"Failed to bulk insert {model_class.__name__}: {e}", exc_info=True
+        )
+        return 0
+
+
 def insert_log(db: Any, **kwargs) -> int | None:
     """Insert log record and return ID. Data should be validated before calling."""
     return _insert_record(db, LLMLog, **kwargs)
@@ -216,36 +261,54 @@ def insert_guardrail_event(db: Any, **kwargs) -> int | None:
     return _insert_record(db, GuardrailEvent, **kwargs)
 
 
-def _log_to_summary_dict(log: LLMLog) -> dict:
-    """Convert LLMLog to summary dictionary."""
-    from wikiagent.monitoring.schemas import LogSummaryResponse
+def bulk_insert_eval_checks(db: Any, rows: list[dict]) -> int:
+    """Insert evaluation checks in one batch. Returns number of rows inserted."""
+    return _bulk_insert_records(db, EvalCheck, rows)
 
-    return LogSummaryResponse(
-        id=log.id,
-        created_at=log.created_at,
-        agent_name=log.agent_name,
-        model=log.model,
-        user_prompt=log.user_prompt,
-        total_cost=log.total_cost,
-        total_input_tokens=log.total_input_tokens,
-        total_output_tokens=log.total_output_tokens,
-    ).model_dump()
+
+def bulk_insert_guardrail_events(db: Any, rows: list[dict]) -> int:
+    """Insert guardrail events in one batch. Returns number of rows inserted."""
+    return _bulk_insert_records(db, GuardrailEvent, rows)
+
+
+# Only the columns shown in the logs list; skips the large TEXT/JSON columns
+_SUMMARY_COLUMNS = (
+    LLMLog.id,
+    LLMLog.created_at,
+    LLMLog.agent_name,
+    LLMLog.model,
+    LLMLog.user_prompt,
+    LLMLog.total_cost,
+    LLMLog.total_input_tokens,
+    LLMLog.total_output_tokens,
+)
 
 
 @_handle_db_errors
 def get_recent_logs(limit: int = DEFAULT_LOG_LIMIT) -> list[dict]:
-    """Get recent logs for display."""
+    """Get recent logs for display (LogSummaryResponse shape)."""
     with get_db() as db:
         if not db:
             return []
 
-        logs = db.query(LLMLog).order_by(LLMLog.created_at.desc()).limit(limit).all()
-        return [_log_to_summary_dict(log) for log in logs]
+        rows = (
+            db.query(*_SUMMARY_COLUMNS)
+            .order_by(LLMLog.created_at.desc(), LLMLog.id.desc())
+            .limit(limit)
+            .all()
+        )
+        # Rows come from our own table, so skip Pydantic validation on the read path
+        return [dict(row._mapping) for row in rows]
+
+
+# Last computed cost stats, keyed by the (row count, newest id) they cover
+_cost_stats_cache: tuple[tuple[int, int | None], dict] | None = None
 
 
 @_handle_db_errors
 def get_cost_stats() -> dict:
-    """Get cost statistics."""
+    """Get cost statistics (cached until a new log is inserted)."""
+    global _cost_stats_cache
     with get_db() as db:
         if not db:
             return {
@@ -254,62 +317,65 @@ def get_cost_stats() -> dict:
                 "avg_cost": DEFAULT_AVG_COST,
             }
 
+        # Logs are append-only. MAX(id) alone is not enough: ids are assigned at
+        # insert, not commit, so a lower id can commit after a higher one. A
+        # late commit still changes COUNT(id), so the pair identifies the totals
+        version = tuple(db.query(func.count(LLMLog.id), func.max(LLMLog.id)).one())
+        if _cost_stats_cache is not None and _cost_stats_cache[0] == version:
+            return dict(_cost_stats_cache[1])
+
+        total_queries = func.count(LLMLog.id)
         result = db.query(
             func.sum(LLMLog.total_cost).label("total_cost"),
-            func.count(LLMLog.id).label("total_queries"),
+            total_queries.label("total_queries"),
+            (func.sum(LLMLog.total_cost) / func.nullif(total_queries, 0)).label(
+                "avg_cost"
+            ),
         ).first()
 
-        total_cost = float(result.total_cost or DEFAULT_TOTAL_COST)
-        total_queries = int(result.total_queries or DEFAULT_TOTAL_QUERIES)
-        avg_cost = total_cost / total_queries if total_queries > 0 else DEFAULT_AVG_COST
-
-        return {
-            "total_cost": total_cost,
-            "total_queries": total_queries,
-            "avg_cost": avg_cost,
+        stats = {
+            "total_cost": float(result.total_cost or DEFAULT_TOTAL_COST),
+            "total_queries": int(result.total_queries or DEFAULT_TOTAL_QUERIES),
+            "avg_cost": float(result.avg_cost or DEFAULT_AVG_COST),
         }
+        _cost_stats_cache = (version, stats)
+        return dict(stats)
 
 
 def _log_to_response_dict(log: LLMLog) -> dict:
-    """Convert LLMLog with relationships to response dictionary."""
-    from wikiagent.monitoring.schemas import (
-        EvalCheckResponse,
-        GuardrailEventResponse,
-        LogResponse,
-    )
-
-    return LogResponse(
-        id=log.id,
-        created_at=log.created_at,
-        agent_name=log.agent_name,
-        provider=log.provider,
-        model=log.model,
-        user_prompt=log.user_prompt,
-        instructions=log.instructions,
-        assistant_answer=log.assistant_answer,
-        total_input_tokens=log.total_input_tokens,
-        total_output_tokens=log.total_output_tokens,
-        input_cost=log.input_cost,
-        output_cost=log.output_cost,
-        total_cost=log.total_cost,
-        checks=[
-            EvalCheckResponse(
-                check_name=check.check_name,
-                passed=check.passed,
-                score=check.score,
-                details=check.details,
-            )
+    """Convert LLMLog with relationships to response dictionary (LogResponse shape)."""
+    return {
+        "id": log.id,
+        "created_at": log.created_at,
+        "agent_name": log.agent_name,
+        "provider": log.provider,
+        "model": log.model,
+        "user_prompt": log.user_prompt,
+        "instructions": log.instructions,
+        "assistant_answer": log.assistant_answer,
+        "total_input_tokens": log.total_input_tokens,
+        "total_output_tokens": log.total_output_tokens,
+        "input_cost": log.input_cost,
+        "output_cost": log.output_cost,
+        "total_cost": log.total_cost,
+        "checks": [
+            {
+                "check_name": check.check_name,
+                "passed": check.passed,
+                "score": check.score,
+                "details": check.details,
+            }
             for check in log.checks
         ],
-        guardrail_events=[
-            GuardrailEventResponse(
-                guardrail_name=event.guardrail_name,
-                triggered=event.triggered,
-                reason=event.reason,
-            )
+        "guardrail_events": [
+            {
+                "guardrail_name": event.guardrail_name,
+                "triggered": event.triggered,
+                "reason": event.reason,
+            }
             for event in log.guardrail_events
         ],
-    ).model_dump()
+    }
 
 
 @_handle_db_errors
@@ -319,7 +385,15 @@ def get_log_with_checks(log_id: int) -> dict | None:
         if not db:
             return None
 
-        log = db.query(LLMLog).filter(LLMLog.id == log_id).first()
+        log = (
+            db.query(LLMLog)
+            .options(
+                selectinload(LLMLog.checks),
+                selectinload(LLMLog.guardrail_events),
+            )
+            .filter(LLMLog.id == log_id)
+            .first()
+        )
         if not log:
             return None
 
@@ -1,14 +1,17 @@
 """Pydantic schemas for data validation and response models."""
 
+from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # Input models (for validation before database operations)
 class LogCreate(BaseModel):
     """Input model for creating a log record."""
 
+    model_config = ConfigDict(extra="forbid")
+
     agent_name: str | None = None
     provider: str | None = None
     model: str | None = None
@@ -17,7 +20,7 @@ class LogCreate(BaseModel):
     total_input_tokens: int | None = None
     total_output_tokens: int | None = None
     assistant_answer: str | None = None
-    raw_json: str | None = None
+    raw_json: dict[str, Any] | None = None
     input_cost: float | None = None
     output_cost: float | None = None
     total_cost: float | None = None
@@ -26,6 +29,8 @@ class LogCreate(BaseModel):
 class EvalCheckCreate(BaseModel):
     """Input model for creating an evaluation check."""
 
+    model_config = ConfigDict(extra="forbid")
+
     log_id: int
     check_name: str
     passed: bool | None = None
@@ -36,6 +41,8 @@ class EvalCheckCreate(BaseModel):
 class GuardrailEventCreate(BaseModel):
     """Input model for creating a guardrail event."""
 
+    model_config = ConfigDict(extra="forbid")
+
     log_id: int
     guardrail_name: str
     triggered: bool
@@ -46,6 +53,8 @@ class GuardrailEventCreate(BaseModel):
 class EvalCheckResponse(BaseModel):
     """Response model for evaluation check."""
 
+    model_config = ConfigDict(frozen=True)
+
     check_name: str
     passed: bool | None
     score: float | None
@@ -55,6 +64,8 @@ class EvalCheckResponse(BaseModel):
 class GuardrailEventResponse(BaseModel):
     """Response model for guardrail event."""
 
+    model_config = ConfigDict(frozen=True)
+
     guardrail_name: str
     triggered: bool
     reason: str | None
@@ -63,8 +74,10 @@ class GuardrailEventResponse(BaseModel):
 class LogResponse(BaseModel):
     """Response model for log with related records."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
-    created_at: Any
+    created_at: datetime
     agent_name: str | None
     provider: str | None
     model: str | None
@@ -83,8 +96,10 @@ class LogResponse(BaseModel):
 class LogSummaryResponse(BaseModel):
     """Response model for log summary (recent logs list)."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
-    created_at: Any
+    created_at: datetime
     agent_name: str | None
     model: str | None
     user_prompt: str | None
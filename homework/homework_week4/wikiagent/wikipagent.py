@@ -1,16 +1,28 @@
-import json
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from collections.abc import Coroutine
+from functools import lru_cache
 from typing import Any, Callable, List
 
 from pydantic_ai import Agent, ModelSettings
 from pydantic_ai.messages import FunctionToolCallEvent
 from pydantic_ai.models.openai import OpenAIChatModel
 from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_core import from_json, to_json
 
 from config import DEFAULT_MAX_TOKENS, DEFAULT_SEARCH_MODE, OPENAI_RAG_MODEL, SearchMode
 from config.adaptive_instructions import get_wikipedia_agent_instructions
-from wikiagent.config import ERROR_MAPPINGS, MAX_QUESTION_LOG_LENGTH, ErrorCategory
+from wikiagent.config import (
+    ERROR_KEYWORD_INDEX,
+    ERROR_KEYWORD_PATTERN,
+    ERROR_KEYWORD_PRIORITY,
+    MAX_QUESTION_LOG_LENGTH,
+    MAX_TOOL_CALL_ARGS_LENGTH,
+    MAX_TOOL_CALLS,
+)
 from wikiagent.models import (
     AgentError,
     SearchAgentAnswer,
@@ -24,79 +36,162 @@ logger = logging.getLogger(__name__)
 QUERY_DISPLAY_LENGTH = 50
 STREAM_DEBOUNCE = 0.01
 STRUCTURED_OUTPUT_FIELDS = ["answer", "confidence", "sources_used", "reasoning"]
+WIKIPEDIA_TOOL_NAMES = frozenset({"wikipedia_search", "wikipedia_get_page"})
+RESPONSE_CACHE_MAXSIZE = 1024  # Max cached query_wikipedia responses
+RESPONSE_CACHE_TTL = 3600  # Seconds a cached response stays valid
+DEFAULT_BATCH_CONCURRENCY = 16  # Max questions in flight in query_wikipedia_batch
+
+# Settings are the same for every agent, so build them once
+_AGENT_MODEL_SETTINGS = ModelSettings(max_tokens=DEFAULT_MAX_TOKENS)
+
+# Any structured output field name, case-insensitive, found in one scan
+_STRUCTURED_OUTPUT_RE = re.compile(
+    "|".join(map(re.escape, STRUCTURED_OUTPUT_FIELDS)), re.IGNORECASE
+)
+
+# (question, model, search mode, store_full_args) -> (stored_at, response);
+# oldest entries first
+_response_cache: OrderedDict[tuple, tuple[float, WikipediaAgentResponse]] = (
+    OrderedDict()
+)
+
+
+def _get_cached_response(key: tuple) -> WikipediaAgentResponse | None:
+    """Return a copy of a fresh cached response, dropping it if expired"""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return response.model_copy(deep=True)
+
+
+def _cache_response(key: tuple, response: WikipediaAgentResponse) -> None:
+    """Store a response, evicting the least recently used entry when full"""
+    _response_cache[key] = (time.monotonic(), response.model_copy(deep=True))
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_MAXSIZE:
+        _response_cache.popitem(last=False)
 
 
 def _parse_tool_args(args: Any, max_length: int = QUERY_DISPLAY_LENGTH) -> str:
     """Extract query from tool args for display purposes"""
-    try:
-        args_dict = json.loads(args) if isinstance(args, str) else args
-        query = (
-            args_dict.get("query", "N/A")[:max_length]
-            if isinstance(args_dict, dict)
-            else str(args)[:max_length]
+    # Branch on type so dict args (already parsed) skip JSON work entirely
+    if isinstance(args, dict):
+        query = args.get("query", "N/A")
+    elif isinstance(args, (str, bytes)):
+        if not args:
+            return "N/A"
+        try:
+            args_dict = from_json(args)
+        except ValueError:
+            args_dict = None
+        if not isinstance(args_dict, dict):
+            return str(args)[:max_length]
+        query = args_dict.get("query", "N/A")
+    else:
+        return str(args)[:max_length]
+    return query[:max_length] if isinstance(query, str) else str(query)[:max_length]
+
+
+def _record_tool_call(
+    event: FunctionToolCallEvent,
+    tool_calls: List[dict],
+    args_max_length: int | None,
+) -> None:
+    """Append a function tool call event to the tool call list"""
+    if len(tool_calls) >= MAX_TOOL_CALLS:
+        logger.debug("Tool call limit reached, not storing %s", event.part.tool_name)
+        return
+    args = event.part.args
+    truncated = (
+        args_max_length is not None
+        and isinstance(args, str)
+        and len(args) > args_max_length
+    )
+    tool_call = {
+        "tool_name": event.part.tool_name,
+        "args": args[:args_max_length] if truncated else args,
+        "truncated": truncated,
+    }
+    tool_calls.append(tool_call)
+    # Runs per tool call: only parse args for display if the line will be emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Tool Call #%d: %s with query: %s...",
+            len(tool_calls),
+            event.part.tool_name,
+            _parse_tool_args(args),
         )
-    except (json.JSONDecodeError, AttributeError, TypeError):
-        query = str(args)[:max_length] if args else "N/A"
-    return query
 
 
 def _create_tool_call_tracker(
     tool_calls: List[dict],
+    store_full_args: bool = False,
 ) -> Callable[[Any, Any], Coroutine[Any, Any, None]]:
     """Create a tool call tracker function that appends to the provided list"""
+    args_max_length = None if store_full_args else MAX_TOOL_CALL_ARGS_LENGTH
 
-    async def track_tool_calls(ctx: Any, event: Any) -> None:
-        if hasattr(event, "__aiter__"):
-            async for sub in event:
-                await track_tool_calls(ctx, sub)
-            return
-
-        if isinstance(event, FunctionToolCallEvent):
-            tool_call = {
-                "tool_name": event.part.tool_name,
-                "args": event.part.args,
-            }
-            tool_calls.append(tool_call)
-            query = _parse_tool_args(event.part.args)
-            logger.info(
-                f"Tool Call #{len(tool_calls)}: {event.part.tool_name} with query: {query}..."
-            )
+    async def track_tool_calls(ctx: Any, events: Any) -> None:
+        # pydantic-ai has no per-event-type subscription; most events are part
+        # deltas, so reject them with a bare type check before any other work
+        async for event in events:
+            if type(event) is FunctionToolCallEvent:
+                _record_tool_call(event, tool_calls, args_max_length)
 
     return track_tool_calls
 
 
+@lru_cache(maxsize=8)
 def _create_agent(openai_model: str, search_mode: SearchMode) -> Agent:
+    """Build the agent once per (model, search mode); agents are reusable across runs"""
     instructions = get_wikipedia_agent_instructions(search_mode)
     model = OpenAIChatModel(model_name=openai_model, provider=OpenAIProvider())
-    logger.info(f"Using OpenAI model: {openai_model}, search mode: {search_mode}")
     return Agent(
         name="wikipedia_agent",
         model=model,
         tools=[wikipedia_search, wikipedia_get_page],
         instructions=instructions,
         output_type=SearchAgentAnswer,
-        model_settings=ModelSettings(max_tokens=DEFAULT_MAX_TOKENS),
+        model_settings=_AGENT_MODEL_SETTINGS,
         end_strategy="exhaustive",
     )
 
 
+@lru_cache(maxsize=64)
+def _type_keyword_position(error_class: type) -> int:
+    """Position of the first error keyword in the class name (len if none)"""
+    error_type_lower = error_class.__name__.lower()
+    for position, (kw, _) in enumerate(ERROR_KEYWORD_INDEX):
+        if kw in error_type_lower:
+            return position
+    return len(ERROR_KEYWORD_INDEX)
+
+
 def _handle_error(e: Exception, tool_calls: List[dict]) -> WikipediaAgentResponse:
     """Convert exception to structured error response"""
     logger.error(f"Error during agent execution: {e}")
     error_type = type(e).__name__
-    error_msg = str(e).lower()
-    error_type_lower = error_type.lower()
-
-    # Find matching error category
-    error_config = None
-    for category in ErrorCategory:
-        mapping = ERROR_MAPPINGS[category]
-        keywords = mapping.get("keywords", [])
-        matches_error_msg = any(kw in error_msg for kw in keywords)
-        matches_error_type = any(kw in error_type_lower for kw in keywords)
-        if matches_error_msg or matches_error_type:
-            error_config = mapping
-            break
+    error_msg = str(e)
+
+    # Find matching error category: the class-name match is cached per class,
+    # the message is scanned once for every keyword and the best rank wins
+    position = min(
+        (
+            ERROR_KEYWORD_PRIORITY[match.group(1).lower()]
+            for match in ERROR_KEYWORD_PATTERN.finditer(error_msg)
+        ),
+        default=len(ERROR_KEYWORD_INDEX),
+    )
+    position = min(position, _type_keyword_position(type(e)))
+    error_config = (
+        ERROR_KEYWORD_INDEX[position][1]
+        if position < len(ERROR_KEYWORD_INDEX)
+        else None
+    )
 
     if error_config:
         agent_error = AgentError(
@@ -122,55 +217,63 @@ def _handle_error(e: Exception, tool_calls: List[dict]) -> WikipediaAgentRespons
 
 
 def _extract_token_usage(usage_obj: Any) -> TokenUsage:
-    return TokenUsage(
-        input_tokens=usage_obj.input_tokens,
-        output_tokens=usage_obj.output_tokens,
-        total_tokens=usage_obj.input_tokens + usage_obj.output_tokens,
+    # Counts come straight from pydantic-ai's usage object, so skip validation
+    input_tokens = usage_obj.input_tokens
+    output_tokens = usage_obj.output_tokens
+    total_tokens = getattr(usage_obj, "total_tokens", None)
+    return TokenUsage.model_construct(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=total_tokens
+        if total_tokens is not None
+        else input_tokens + output_tokens,
     )
 
 
 def _is_structured_output(args_str: str) -> bool:
     """Check if args contain structured output fields"""
-    return any(field in args_str.lower() for field in STRUCTURED_OUTPUT_FIELDS)
+    return _STRUCTURED_OUTPUT_RE.search(args_str) is not None
 
 
-def _calculate_delta(current_text: str, previous_text: str) -> str:
-    """Calculate delta between current and previous text"""
-    return current_text[len(previous_text) :]
+def _calculate_delta(current_text: str, previous_len: int) -> str:
+    """Calculate delta: the text past what was already emitted"""
+    return current_text[previous_len:]
 
 
 def _process_streaming_part(
     part: Any,
     tool_call_callback: Callable[[str, str], None] | None,
     structured_output_callback: Callable[[str], None] | None,
-    previous_text: str,
-) -> tuple[str, bool]:
+    previous_len: int,
+) -> tuple[int, bool]:
     """
     Process a single streaming part.
-    Returns: (updated_previous_text, handled)
+    Returns: (updated_previous_len, handled)
     """
-    if not hasattr(part, "tool_name"):
-        return previous_text, False
+    tool_name = getattr(part, "tool_name", None)
+    if tool_name is None:
+        return previous_len, False
 
-    tool_name = part.tool_name
     args = part.args
 
     # Handle Wikipedia tool calls
-    if tool_name in {"wikipedia_search", "wikipedia_get_page"}:
+    if tool_name in WIKIPEDIA_TOOL_NAMES:
         if tool_call_callback:
             tool_call_callback(tool_name, args)
-        return previous_text, True
+        return previous_len, True
 
-    # Handle structured output
+    # Handle structured output (nothing to compute without a consumer)
+    if structured_output_callback is None:
+        return previous_len, False
     if tool_name and args:
-        args_str = args if isinstance(args, str) else json.dumps(args)
+        args_str = args if isinstance(args, str) else to_json(args).decode()
         if _is_structured_output(args_str):
-            delta = _calculate_delta(args_str, previous_text)
-            if structured_output_callback and delta:
+            delta = _calculate_delta(args_str, previous_len)
+            if delta:
                 structured_output_callback(delta)
-            return args_str, True
+            return len(args_str), True
 
-    return previous_text, False
+    return previous_len, False
 
 
 async def query_wikipedia(
@@ -178,17 +281,36 @@ async def query_wikipedia(
     openai_model: str = OPENAI_RAG_MODEL,
     search_mode: SearchMode = DEFAULT_SEARCH_MODE,
     agent: Agent | None = None,
+    store_full_args: bool = False,
+    use_cache: bool = True,
 ) -> WikipediaAgentResponse:
-    """Query Wikipedia using the agent with search and get_page tools."""
+    """
+    Query Wikipedia using the agent with search and get_page tools.
+
+    Successful answers from the default agent are cached per
+    (question, model, search mode) for RESPONSE_CACHE_TTL seconds; pass
+    use_cache=False to always run the agent (e.g. when measuring token usage).
+    Raw tool call args are cut to MAX_TOOL_CALL_ARGS_LENGTH unless store_full_args.
+    """
     tool_calls: List[dict] = []
+    cache_key = None
     if agent is None:
+        if use_cache:
+            cache_key = (question.strip(), openai_model, search_mode, store_full_args)
+            cached = _get_cached_response(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Cache hit for query: {question[:MAX_QUESTION_LOG_LENGTH]}..."
+                )
+                return cached
+        logger.info(f"Using OpenAI model: {openai_model}, search mode: {search_mode}")
         agent = _create_agent(openai_model, search_mode)
     logger.info(
         f"Running Wikipedia agent query: {question[:MAX_QUESTION_LOG_LENGTH]}..."
     )
 
     try:
-        track_handler = _create_tool_call_tracker(tool_calls)
+        track_handler = _create_tool_call_tracker(tool_calls, store_full_args)
         result = await agent.run(question, event_stream_handler=track_handler)
     except Exception as e:
         return _handle_error(e, tool_calls)
@@ -196,13 +318,45 @@ async def query_wikipedia(
     logger.info(f"Agent completed query. Tool calls: {len(tool_calls)}")
     usage = _extract_token_usage(result.usage())
     logger.info(
-        f"Token usage - Input: {usage.input_tokens}, Output: {usage.output_tokens}, Total: {usage.total_tokens}"
+        "Token usage - Input: %d, Output: %d, Total: %d",
+        usage.input_tokens,
+        usage.output_tokens,
+        usage.total_tokens,
     )
-    return WikipediaAgentResponse(
+    response = WikipediaAgentResponse(
         answer=result.output,
         tool_calls=tool_calls,
         usage=usage,
     )
+    if cache_key is not None:
+        _cache_response(cache_key, response)
+    return response
+
+
+async def query_wikipedia_batch(
+    questions: List[str],
+    openai_model: str = OPENAI_RAG_MODEL,
+    search_mode: SearchMode = DEFAULT_SEARCH_MODE,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    agent: Agent | None = None,
+    store_full_args: bool = False,
+    use_cache: bool = True,
+) -> List[WikipediaAgentResponse]:
+    """
+    Answer several questions concurrently, at most `concurrency` at a time.
+
+    Each question goes through query_wikipedia, so errors come back as error
+    responses rather than aborting the batch. Results keep the input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _query_one(question: str) -> WikipediaAgentResponse:
+        async with semaphore:
+            return await query_wikipedia(
+                question, openai_model, search_mode, agent, store_full_args, use_cache
+            )
+
+    return await asyncio.gather(*(_query_one(q) for q in questions))
 
 
 async def query_wikipedia_stream(
@@ -212,36 +366,43 @@ async def query_wikipedia_stream(
     tool_call_callback: Callable[[str, str], None] | None = None,
     structured_output_callback: Callable[[str], None] | None = None,
     agent: Agent | None = None,
+    store_full_args: bool = False,
 ) -> WikipediaAgentResponse:
     """Query Wikipedia using the agent with streaming support for real-time updates."""
     tool_calls: List[dict] = []
     if agent is None:
+        logger.info(f"Using OpenAI model: {openai_model}, search mode: {search_mode}")
         agent = _create_agent(openai_model, search_mode)
     logger.info(
         f"Running Wikipedia agent query with streaming: {question[:MAX_QUESTION_LOG_LENGTH]}..."
     )
-    previous_text = ""
+    previous_len = 0
 
     try:
-        track_handler = _create_tool_call_tracker(tool_calls)
+        track_handler = _create_tool_call_tracker(tool_calls, store_full_args)
         async with agent.run_stream(
             question, event_stream_handler=track_handler
         ) as result:
-            async for item, last in result.stream_responses(
-                debounce_by=STREAM_DEBOUNCE
-            ):
-                for part in item.parts:
-                    previous_text, _ = _process_streaming_part(
-                        part,
-                        tool_call_callback,
-                        structured_output_callback,
-                        previous_text,
-                    )
+            # Without callbacks there is nobody to stream to; just await the output
+            if tool_call_callback or structured_output_callback:
+                async for item, last in result.stream_responses(
+                    debounce_by=STREAM_DEBOUNCE
+                ):
+                    for part in item.parts:
+                        previous_len, _ = _process_streaming_part(
+                            part,
+                            tool_call_callback,
+                            structured_output_callback,
+                            previous_len,
+                        )
 
             final_output = await result.get_output()
             usage = _extract_token_usage(result.usage())
             logger.info(
-                f"📊 Token Usage - Input: {usage.input_tokens:,}, Output: {usage.output_tokens:,}, Total: {usage.total_tokens:,}"
+                "📊 Token Usage - Input: %d, Output: %d, Total: %d",
+                usage.input_tokens,
+                usage.output_tokens,
+                usage.total_tokens,
             )
             return WikipediaAgentResponse(
                 answer=final_output,